@@ -47,7 +47,9 @@ SYSTEM_STATUS_WAIT = "Waiting..."
 SYSTEM_STATUS_IDLE = "System Idle"
 SYSTEM_STATUS_OFF = "System Off"
 
-BLOWER_OFF_STATUSES = {SYSTEM_STATUS_WAIT, SYSTEM_STATUS_IDLE, SYSTEM_STATUS_OFF}
+BLOWER_OFF_STATUSES = frozenset(
+    (SYSTEM_STATUS_WAIT, SYSTEM_STATUS_IDLE, SYSTEM_STATUS_OFF)
+)
 
 AIR_CLEANER_MODE_AUTO = "auto"
 AIR_CLEANER_MODE_QUICK = "quick"
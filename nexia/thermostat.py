@@ -6,11 +6,20 @@ import logging
 from typing import TYPE_CHECKING, Any
 
 from .const import AIR_CLEANER_MODES, BLOWER_OFF_STATUSES, HUMIDITY_MAX, HUMIDITY_MIN
-from .util import find_dict_with_keyvalue_in_json, find_humidity_setpoint, is_number
+from .util import find_humidity_setpoint, index_dicts_by_key
 from .zone import NexiaThermostatZone
 
 _LOGGER = logging.getLogger(__name__)
 
+_AIR_CLEANER_MODES_SET = frozenset(AIR_CLEANER_MODES)
+
+_BOOL_TO_STR = {True: "true", False: "false"}
+
+# Top level thermostat JSON keys the has_* capability flags are derived from
+_CAPABILITY_KEYS = frozenset(
+    ("settings", "has_outdoor_temperature", "indoor_humidity", "zones")
+)
+
 
 if TYPE_CHECKING:
     from .home import NexiaHome
@@ -27,13 +36,31 @@ class NexiaThermostat:
         self._nexia_home = nexia_home
         self.thermostat_id: int = thermostat_json["id"]
         self._thermostat_json = thermostat_json
-        if self.has_zones():
-            self.zones = [
+        self._url_prefix = (
+            f"{nexia_home.mobile_url}/xxl_thermostats/{self.thermostat_id}/"
+        )
+        # Lookup tables derived from the JSON, filled in by _rebuild_indexes
+        self._settings_by_type: dict[Any, dict[str, Any]] = {}
+        self._fan_mode_label_to_value: dict[str, Any] = {}
+        self._fan_mode_value_to_label: dict[Any, str] = {}
+        self._features_by_name: dict[Any, dict[str, Any]] = {}
+        self._advanced_info_by_label: dict[Any, dict[str, Any]] = {}
+        self._unit: str | None = None
+        self._capabilities: dict[str, bool] = {}
+        self._rebuild_indexes()
+        self.zones: list[NexiaThermostatZone] = (
+            [
                 NexiaThermostatZone(nexia_home, self, zone)
                 for zone in thermostat_json["zones"]
             ]
-        else:
-            self.zones = []
+            if self.has_zones()
+            else []
+        )
+        self._zones_by_id: dict[int, NexiaThermostatZone] = {}
+        for zone in self.zones:
+            # The first zone with a given id wins, as with the old linear scan
+            self._zones_by_id.setdefault(zone.zone_id, zone)
+        self._zone_ids = tuple(zone.zone_id for zone in self.zones)
 
     @property
     def API_MOBILE_THERMOSTAT_URL(self):  # pylint: disable=invalid-name
@@ -41,6 +68,11 @@ class NexiaThermostat:
             self._nexia_home.mobile_url + "/xxl_thermostats/{thermostat_id}/{end_point}"
         )
 
+    @property
+    def _thermostat_feature(self) -> dict[str, Any]:
+        """The "thermostat" feature holding the unit, deadband and limits."""
+        return self._get_thermostat_features_key("thermostat")
+
     @property
     def is_online(self):
         """Returns whether the thermostat is online or not.
@@ -52,16 +84,8 @@ class NexiaThermostat:
         """Lookup advanced_info in the thermostat features and find the value of the
         requested label.
         """
-        advanced_info = self._get_thermostat_features_key("advanced_info")
-
-        try:
-            return find_dict_with_keyvalue_in_json(
-                advanced_info["items"],
-                "label",
-                label,
-            )["value"]
-        except KeyError:
-            return None
+        item = self._advanced_info_by_label.get(label)
+        return item.get("value") if item else None
 
     def get_model(self):
         """Returns the thermostat model
@@ -111,14 +135,14 @@ class NexiaThermostat:
         temperature sensor
         :return: bool.
         """
-        return self._get_thermostat_key_or_none("has_outdoor_temperature")
+        return self._capabilities["outdoor_temperature"]
 
     def has_relative_humidity(self):
         """Capability indication of whether the thermostat has a relative
         humidity sensor
         :return: bool.
         """
-        return bool(self._get_thermostat_key_or_none("indoor_humidity"))
+        return self._capabilities["relative_humidity"]
 
     def has_variable_speed_compressor(self):
         """Capability indication of whether the thermostat has a variable speed
@@ -132,32 +156,32 @@ class NexiaThermostat:
         """Capability indication of whether the thermostat has emergency/aux heat.
         :return: bool.
         """
-        return bool(self.get_thermostat_settings_key_or_none("emergency_heat"))
+        return self._capabilities["emergency_heat"]
 
     def has_variable_fan_speed(self):
         """Capability indication of whether the thermostat has a variable speed
         blower
         :return: bool.
         """
-        return bool(self.get_thermostat_settings_key_or_none("fan_speed"))
+        return self._capabilities["variable_fan_speed"]
 
     def has_zones(self):
         """Indication of whether zoning is enabled or not on the thermostat.
         :return: bool.
         """
-        return bool(self._get_thermostat_key_or_none("zones"))
+        return self._capabilities["zones"]
 
     def has_dehumidify_support(self):
         """Indication of whether dehumidifying support is available.
         :return: bool.
         """
-        return bool(self.get_thermostat_settings_key_or_none("dehumidify"))
+        return self._capabilities["dehumidify"]
 
     def has_humidify_support(self):
         """Indication of whether humidifying support is available.
         :return: bool.
         """
-        return bool(self.get_thermostat_settings_key_or_none("humidify"))
+        return self._capabilities["humidify"]
 
     ########################################################################
     # System Attributes
@@ -169,7 +193,7 @@ class NexiaThermostat:
         thermostat.
         :return: int.
         """
-        return self._get_thermostat_features_key("thermostat")["setpoint_delta"]
+        return self._thermostat_feature["setpoint_delta"]
 
     def get_setpoint_limits(self):
         """Returns a tuple of the minimum and maximum temperature that can be set
@@ -177,9 +201,20 @@ class NexiaThermostat:
         thermostat.
         :return: (int, int).
         """
+        thermostat = self._thermostat_feature
+        return thermostat["setpoint_heat_min"], thermostat["setpoint_cool_max"]
+
+    def get_temperature_constraints(self):
+        """Returns a tuple of the deadband and the minimum and maximum
+        temperature that can be set on any zone, in the temperature unit
+        selected by the thermostat.
+        :return: (int, int, int).
+        """
+        thermostat = self._thermostat_feature
         return (
-            self._get_thermostat_features_key("thermostat")["setpoint_heat_min"],
-            self._get_thermostat_features_key("thermostat")["setpoint_cool_max"],
+            thermostat["setpoint_delta"],
+            thermostat["setpoint_heat_min"],
+            thermostat["setpoint_cool_max"],
         )
 
     def get_variable_fan_speed_limits(self):
@@ -195,7 +230,11 @@ class NexiaThermostat:
         """Returns the temperature unit used by this system, either C or F.
         :return: str.
         """
-        return self._get_thermostat_features_key("thermostat")["scale"].upper()
+        unit = self._unit
+        if unit is None:
+            # Raise the same errors as before for a missing feature or scale
+            return self._thermostat_feature["scale"].upper()
+        return unit
 
     def get_humidity_setpoint_limits(self):
         """Returns the humidity setpoint limits of the thermostat.
@@ -232,30 +271,25 @@ class NexiaThermostat:
 
         :return:
         """
-        options = self.get_thermostat_settings_key("fan_mode")["options"]
-        return [opt["label"] for opt in options]
+        return list(self._fan_mode_label_to_value)
 
     def get_fan_mode(self):
         """Returns the current fan mode. See get_fan_modes for the available options.
         :return: str.
         """
-        fan_mode = self.get_thermostat_settings_key("fan_mode")
-        current_value = fan_mode["current_value"]
-        options = fan_mode["options"]
-        for opt in options:
-            if opt["value"] == current_value:
-                return opt["label"]
-        return None
+        current_value = self.get_thermostat_settings_key("fan_mode")["current_value"]
+        return self._fan_mode_value_to_label.get(current_value)
 
     def get_outdoor_temperature(self):
         """Returns the outdoor temperature.
         :return: float - the temperature, returns nan if invalid.
         """
         if self.has_outdoor_temperature():
-            outdoor_temp = self._get_thermostat_key("outdoor_temperature")
-            if is_number(outdoor_temp):
-                return float(outdoor_temp)
-            return float("Nan")
+            try:
+                return float(self._get_thermostat_key("outdoor_temperature"))
+            except (TypeError, ValueError):
+                # null or non-numeric readings mean the sensor has no data
+                return float("Nan")
         raise RuntimeError("This system does not have an outdoor temperature sensor")
 
     def get_relative_humidity(self):
@@ -320,17 +354,18 @@ class NexiaThermostat:
         """Returns the system status such as "System Idle" or "Cooling"
         :return: str.
         """
+        thermostat_json = self._thermostat_json
         return (
-            self._get_thermostat_key_or_none("system_status")
-            or self._get_thermostat_key_or_none("operating_state")
-            or self._get_thermostat_features_key("thermostat")["status"]
+            thermostat_json.get("system_status")
+            or thermostat_json.get("operating_state")
+            or self._thermostat_feature["status"]
         )
 
     def has_air_cleaner(self):
         """Returns if the system has an air cleaner.
         :return: bool.
         """
-        return bool(self.get_thermostat_settings_key_or_none("air_cleaner_mode"))
+        return self._capabilities["air_cleaner"]
 
     def get_air_cleaner_mode(self):
         """Returns the system's air cleaner mode
@@ -346,14 +381,9 @@ class NexiaThermostat:
         :param fan_mode: string that must be in self.get_fan_modes()
         :return: None.
         """
-        fan_mode_data = self.get_thermostat_settings_key("fan_mode")
-        options = fan_mode_data["options"]
-        for opt in options:
-            if opt["label"] == fan_mode:
-                fan_mode = opt["value"]
-                break
-
-        await self._post_and_update_thermostat_json("fan_mode", {"value": fan_mode})
+        fan_mode = self._fan_mode_label_to_value.get(fan_mode, fan_mode)
+        if not self._is_setting_current_value("fan_mode", fan_mode):
+            await self._post_and_update_thermostat_json("fan_mode", {"value": fan_mode})
 
     async def set_fan_setpoint(self, fan_setpoint: float):
         """Sets the fan's setpoint speed as a percent in range. You can see the
@@ -366,10 +396,11 @@ class NexiaThermostat:
         min_speed, max_speed = self.get_variable_fan_speed_limits()
 
         if min_speed <= fan_setpoint <= max_speed:
-            await self._post_and_update_thermostat_json(
-                "fan_speed",
-                {"value": fan_setpoint},
-            )
+            if fan_setpoint != self.get_fan_speed_setpoint():
+                await self._post_and_update_thermostat_json(
+                    "fan_speed",
+                    {"value": fan_setpoint},
+                )
         else:
             raise ValueError(
                 f"The fan setpoint, {fan_setpoint} is not "
@@ -383,7 +414,7 @@ class NexiaThermostat:
         :return: None.
         """
         air_cleaner_mode = air_cleaner_mode.lower()
-        if air_cleaner_mode in AIR_CLEANER_MODES:
+        if air_cleaner_mode in _AIR_CLEANER_MODES_SET:
             if air_cleaner_mode != self.get_air_cleaner_mode():
                 await self._post_and_update_thermostat_json(
                     "air_cleaner_mode",
@@ -398,10 +429,12 @@ class NexiaThermostat:
         current setpoints
         :return: None.
         """
-        await self._post_and_update_thermostat_json(
-            "scheduling_enabled",
-            {"value": "true" if follow_schedule else "false"},
-        )
+        follow_schedule = bool(follow_schedule)
+        if not self._is_setting_current_value("scheduling_enabled", follow_schedule):
+            await self._post_and_update_thermostat_json(
+                "scheduling_enabled",
+                {"value": _BOOL_TO_STR[follow_schedule]},
+            )
 
     async def set_emergency_heat(self, emergency_heat_on):
         """Enables or disables emergency / auxiliary heat.
@@ -409,10 +442,12 @@ class NexiaThermostat:
         :return: None.
         """
         if self.has_emergency_heat():
-            await self._post_and_update_thermostat_json(
-                "emergency_heat",
-                {"value": "true" if emergency_heat_on else "false"},
-            )
+            emergency_heat_on = bool(emergency_heat_on)
+            if emergency_heat_on != self.is_emergency_heat_active():
+                await self._post_and_update_thermostat_json(
+                    "emergency_heat",
+                    {"value": _BOOL_TO_STR[emergency_heat_on]},
+                )
         else:
             raise RuntimeError("This thermostat does not support emergency heat.")
 
@@ -433,20 +468,22 @@ class NexiaThermostat:
                 "Setting target humidity is not supported on this thermostat.",
             )
         (min_humidity, max_humidity) = self.get_humidity_setpoint_limits()
-        if self.has_humidify_support():
+        humidify_setting = self._settings_by_type.get("humidify")
+        dehumidify_setting = self._settings_by_type.get("dehumidify")
+        if humidify_setting:
             humidify_supported = True
             if humidify_setpoint is None:
-                humidify_setpoint = self.get_humidify_setpoint()
+                humidify_setpoint = humidify_setting["current_value"]
         else:
             if humidify_setpoint is not None:
                 raise RuntimeError("This thermostat does not support humidifying.")
             humidify_supported = False
             humidify_setpoint = 0
 
-        if self.has_dehumidify_support():
+        if dehumidify_setting:
             dehumidify_supported = True
             if dehumidify_setpoint is None:
-                dehumidify_setpoint = self.get_dehumidify_setpoint()
+                dehumidify_setpoint = dehumidify_setting["current_value"]
         else:
             if dehumidify_setpoint is not None:
                 raise RuntimeError("This thermostat does not support dehumidifying.")
@@ -479,12 +516,19 @@ class NexiaThermostat:
                 f"humidify_setpoint must be between ({min_humidity} - {max_humidity})",
             )
 
-        if dehumidify_supported:
+        # The posts are sent one after the other: each response is a full
+        # thermostat JSON that replaces the cached settings, so a response
+        # arriving out of order could revert the other setpoint in the cache.
+        # Setpoints already at their current value are not sent again.
+        if (
+            dehumidify_setting
+            and dehumidify_setpoint != dehumidify_setting["current_value"]
+        ):
             await self._post_and_update_thermostat_json(
                 "dehumidify",
                 {"value": str(dehumidify_setpoint)},
             )
-        if humidify_supported:
+        if humidify_setting and humidify_setpoint != humidify_setting["current_value"]:
             await self._post_and_update_thermostat_json(
                 "humidify",
                 {"value": str(humidify_setpoint)},
@@ -515,39 +559,18 @@ class NexiaThermostat:
         """Returns a list of available zone IDs with a starting index of 0.
         :return: list(int).
         """
-        # The zones are in a list, so there are no keys to pull out. I have to
-        # create a new list of IDs.
-        return [zone.zone_id for zone in self.zones]
+        return list(self._zone_ids)
 
     def get_zone_by_id(self, zone_id):
         """Get a zone by its nexia id."""
-        for zone in self.zones:
-            if zone.zone_id == zone_id:
-                return zone
-        raise KeyError
-
-    def _get_thermostat_deep_key(
-        self,
-        area: str,
-        area_primary_key: str,
-        key: str,
-    ) -> Any:
-        """Returns the thermostat value from deep inside the thermostat's
-        JSON.
-        :param area: The area of the json to look i.e. "settings", "features", etc.
-        :param area_primary_key: The name of the primary key such as "name" or "key"
-        :param key: str
-        :return: value.
-        """
-        data = find_dict_with_keyvalue_in_json(
-            self._thermostat_json[area],
-            area_primary_key,
-            key,
-        )
-
-        if not data:
-            raise KeyError(f'Key "{key}" not in the thermostat JSON!')
-        return data
+        zones_by_id = self._zones_by_id
+        try:
+            return zones_by_id[zone_id]
+        except KeyError:
+            valid_ids = ", ".join(str(id_) for id_ in zones_by_id)
+            raise KeyError(
+                f"Zone ID {zone_id} not found, valid IDs are: {valid_ids}"
+            ) from None
 
     def _get_thermostat_features_key_or_none(self, key: str):
         """Returns the thermostat value from the provided key in the thermostat's
@@ -555,10 +578,7 @@ class NexiaThermostat:
         :param key: str
         :return: value.
         """
-        try:
-            return self._get_thermostat_features_key(key)
-        except KeyError:
-            return None
+        return self._features_by_name.get(key)
 
     def _get_thermostat_features_key(self, key: str):
         """Returns the thermostat value from the provided key in the thermostat's
@@ -566,7 +586,10 @@ class NexiaThermostat:
         :param key: str
         :return: value.
         """
-        return self._get_thermostat_deep_key("features", "name", key)
+        try:
+            return self._features_by_name[key]
+        except KeyError:
+            raise KeyError(f'Key "{key}" not in the thermostat JSON!') from None
 
     def _get_thermostat_key_or_none(self, key):
         """Returns the thermostat value from the provided key in the thermostat's
@@ -586,7 +609,7 @@ class NexiaThermostat:
         if key in thermostat:
             return thermostat[key]
 
-        raise KeyError(f'Key "{key}" not in the thermostat JSON ({thermostat}!')
+        raise KeyError(f'Key "{key}" not in the thermostat JSON!')
 
     def get_thermostat_settings_key_or_none(self, key):
         """Returns the thermostat value from the provided key in the thermostat's
@@ -594,10 +617,17 @@ class NexiaThermostat:
         :param key: str
         :return: value.
         """
-        try:
-            return self.get_thermostat_settings_key(key)
-        except KeyError:
-            return None
+        return self._settings_by_type.get(key)
+
+    def _is_setting_current_value(self, key: str, value: Any) -> bool:
+        """Returns True if the thermostat setting is known to already be set to
+        value. Setters use this to skip POSTs that would change nothing.
+        :param key: str
+        :param value: the value about to be set
+        :return: bool.
+        """
+        setting = self._settings_by_type.get(key)
+        return setting is not None and setting.get("current_value") == value
 
     def get_thermostat_settings_key(self, key):
         """Returns the thermostat value from the provided key in the thermostat's
@@ -605,7 +635,61 @@ class NexiaThermostat:
         :param key: str
         :return: value.
         """
-        return self._get_thermostat_deep_key("settings", "type", key)
+        try:
+            return self._settings_by_type[key]
+        except KeyError:
+            raise KeyError(f'Key "{key}" not in the thermostat JSON!') from None
+
+    def _rebuild_indexes(self) -> None:
+        """Rebuild all the lookup tables derived from the thermostat's JSON."""
+        self._index_settings()
+        self._index_features()
+        self._update_capabilities()
+
+    def _index_settings(self) -> None:
+        """Rebuild the lookup tables derived from the thermostat's settings."""
+        self._settings_by_type = index_dicts_by_key(
+            self._thermostat_json.get("settings") or (), "type"
+        )
+        fan_mode = self.get_thermostat_settings_key_or_none("fan_mode")
+        fan_mode_options = fan_mode["options"] if fan_mode else ()
+        self._fan_mode_label_to_value = {
+            opt["label"]: opt["value"] for opt in fan_mode_options
+        }
+        self._fan_mode_value_to_label = {
+            opt["value"]: opt["label"] for opt in fan_mode_options
+        }
+
+    def _index_features(self) -> None:
+        """Rebuild the lookup tables derived from the thermostat's features."""
+        self._features_by_name = index_dicts_by_key(
+            self._thermostat_json.get("features") or (), "name"
+        )
+        advanced_info = self._get_thermostat_features_key_or_none("advanced_info")
+        self._advanced_info_by_label = (
+            index_dicts_by_key(advanced_info["items"], "label") if advanced_info else {}
+        )
+        # The unit is read by round_temp on every zone
+        thermostat = self._features_by_name.get("thermostat")
+        scale = thermostat.get("scale") if thermostat else None
+        self._unit = scale.upper() if scale else None
+
+    def _update_capabilities(self) -> None:
+        """Recompute the capability flags returned by the has_* methods."""
+        settings_key_or_none = self.get_thermostat_settings_key_or_none
+        thermostat_key_or_none = self._get_thermostat_key_or_none
+        self._capabilities = {
+            "outdoor_temperature": bool(
+                thermostat_key_or_none("has_outdoor_temperature")
+            ),
+            "relative_humidity": bool(thermostat_key_or_none("indoor_humidity")),
+            "zones": bool(thermostat_key_or_none("zones")),
+            "emergency_heat": bool(settings_key_or_none("emergency_heat")),
+            "variable_fan_speed": bool(settings_key_or_none("fan_speed")),
+            "dehumidify": bool(settings_key_or_none("dehumidify")),
+            "humidify": bool(settings_key_or_none("humidify")),
+            "air_cleaner": bool(settings_key_or_none("air_cleaner_mode")),
+        }
 
     def _get_zone_json(self, zone_id=0):
         """Returns the thermostat zone's JSON
@@ -616,8 +700,9 @@ class NexiaThermostat:
         if not thermostat:
             return None
 
-        zone = find_dict_with_keyvalue_in_json(thermostat["zones"], "id", zone_id)
-
+        zone = next(
+            (zone for zone in thermostat["zones"] if zone.get("id") == zone_id), None
+        )
         if not zone:
             raise IndexError(
                 f"The zone_id ({zone_id}) does not exist in the thermostat zones.",
@@ -625,12 +710,10 @@ class NexiaThermostat:
         return zone
 
     async def _post_and_update_thermostat_json(self, end_point, payload):
-        url = self.API_MOBILE_THERMOSTAT_URL.format(
-            end_point=end_point,
-            thermostat_id=self._thermostat_json["id"],
-        )
+        url = f"{self._url_prefix}{end_point}"
         async with await self._nexia_home.post_url(url, payload) as response:
-            self.update_thermostat_json((await response.json())["result"])
+            result = (await response.json())["result"]
+        self.update_thermostat_json(result)
 
     def update_thermostat_json(self, thermostat_json):
         """Update with new json from the api."""
@@ -642,11 +725,16 @@ class NexiaThermostat:
             self.thermostat_id,
         )
         self._thermostat_json.update(thermostat_json)
-
-        zone_updates_by_id = {}
-        for zone_json in thermostat_json["zones"]:
-            zone_updates_by_id[zone_json["id"]] = zone_json
-
-        for zone in self.zones:
-            if zone.zone_id in zone_updates_by_id:
-                zone.update_zone_json(zone_updates_by_id[zone.zone_id])
+        # Only rebuild the lookup tables for the sections this update replaced
+        if "settings" in thermostat_json:
+            self._index_settings()
+        if "features" in thermostat_json:
+            self._index_features()
+        if not _CAPABILITY_KEYS.isdisjoint(thermostat_json):
+            self._update_capabilities()
+
+        zones_by_id = self._zones_by_id
+        for zone_json in thermostat_json.get("zones") or ():
+            zone = zones_by_id.get(zone_json["id"])
+            if zone is not None:
+                zone.update_zone_json(zone_json)
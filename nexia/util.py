@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
-import json
 import uuid
 from json import JSONDecodeError
 
+import orjson
+
+# Every humidity setpoint the API accepts: 0.0 to 1.0 in 0.05 steps
+_HUMIDITY_STEPS = tuple(round(i * 0.05, 2) for i in range(21))
+
 
 def is_number(string: str) -> bool:
     """String is a number."""
@@ -31,11 +35,25 @@ def find_dict_with_keyvalue_in_json(json_dict, key_in_subdict, value_to_find):
     raise KeyError
 
 
+def index_dicts_by_key(json_list, key_in_subdict):
+    """Indexes a list of json dicts by the value of key_in_subdict. When
+    several dicts share a value the first one wins, matching
+    find_dict_with_keyvalue_in_json
+    :param json_list: list of dicts
+    :param key_in_subdict: str - the name of the key in the subdict to index by
+    :return: dict of value to subdict.
+    """
+    index = {}
+    for data_group in json_list:
+        index.setdefault(data_group.get(key_in_subdict), data_group)
+    return index
+
+
 def load_or_create_uuid(filename: str) -> uuid.UUID | None:
     """Load or create a uuid for the device."""
     try:
-        with open(filename, encoding="utf-8") as fptr:
-            jsonf = json.loads(fptr.read())
+        with open(filename, "rb") as fptr:
+            jsonf = orjson.loads(fptr.read())  # pylint: disable=no-member
             return uuid.UUID(jsonf["nexia_uuid"], version=4)
     except (JSONDecodeError, FileNotFoundError):
         return _create_uuid(filename)
@@ -45,12 +63,13 @@ def load_or_create_uuid(filename: str) -> uuid.UUID | None:
 
 def _create_uuid(filename):
     """Create a uuid for the device."""
-    with open(filename, "w", encoding="utf-8") as fptr:
+    with open(filename, "wb") as fptr:
         new_uuid = uuid.uuid4()
-        fptr.write(json.dumps({"nexia_uuid": str(new_uuid)}))
+        fptr.write(orjson.dumps({"nexia_uuid": str(new_uuid)}))  # pylint: disable=no-member
         return new_uuid
 
 
 def find_humidity_setpoint(setpoint):
     """Find the closest humidity setpoint."""
-    return round(0.05 * round(setpoint / 0.05), 2)
+    # Snap to the 0.05 grid (1/20) and clamp to 0.0-1.0
+    return _HUMIDITY_STEPS[min(20, max(0, int(setpoint * 20 + 0.5)))]
@@ -18,18 +18,56 @@ from .const import (
     UNIT_CELSIUS,
     ZONE_IDLE,
 )
-from .util import find_dict_with_keyvalue_in_json
+from .util import find_dict_with_keyvalue_in_json, index_dicts_by_key
 
 _LOGGER = logging.getLogger(__name__)
 
+_MISSING = object()
+
+_OPERATION_MODES_SET = frozenset(OPERATION_MODES)
+
+# Zone settings that live under a different name in the thermostat settings
+# when zoning is disabled
+_NON_ZONING_SETTING_KEYS = {"zone_mode": "system_mode"}
+
 if TYPE_CHECKING:
     from .home import NexiaHome
     from .thermostat import NexiaThermostat
 
 
+def _resolve_preset(preset_selected: dict[str, Any]) -> str:
+    """Returns the label of the currently selected preset
+    :param preset_selected: dict - the zone's preset_selected setting
+    :return: str.
+    """
+    current_value = preset_selected["current_value"]
+    if isinstance(current_value, int):
+        return preset_selected["labels"][current_value]
+    for option in preset_selected["options"]:
+        if option["value"] == current_value:
+            return option["label"]
+    raise ValueError(f"Unknown preset {current_value}")
+
+
 class NexiaThermostatZone:
     """A nexia thermostat zone."""
 
+    __slots__ = (
+        "_features_by_name",
+        "_has_zoning",
+        "_is_native_zone",
+        "_nexia_home",
+        "_preset_label_to_value",
+        "_preset_labels",
+        "_preset_options",
+        "_setpoints",
+        "_settings_by_type",
+        "_url_prefix",
+        "_zone_json",
+        "thermostat",
+        "zone_id",
+    )
+
     def __init__(
         self,
         nexia_home: NexiaHome,
@@ -41,6 +79,19 @@ class NexiaThermostatZone:
         self._zone_json = zone_json
         self.thermostat = nexia_thermostat
         self.zone_id: int = zone_json["id"]
+        self._url_prefix = f"{nexia_home.mobile_url}/xxl_zones/{self.zone_id}/"
+        self._is_native_zone = zone_json.get("name") == "NativeZone"
+        self._setpoints: dict[str, Any] | None = zone_json.get("setpoints")
+        # Lookups derived from the last seen preset options list,
+        # see _index_preset_options
+        self._preset_options: list[dict[str, Any]] | None = None
+        self._preset_labels: tuple[str, ...] = ()
+        self._preset_label_to_value: dict[str, Any] = {}
+        # Lookup tables derived from the JSON, filled in by _rebuild_indexes
+        self._has_zoning = False
+        self._settings_by_type: dict[Any, dict[str, Any]] = {}
+        self._features_by_name: dict[Any, dict[str, Any]] = {}
+        self._rebuild_indexes()
 
     @property
     def API_MOBILE_ZONE_URL(self) -> str:  # pylint: disable=invalid-name
@@ -59,19 +110,22 @@ class NexiaThermostatZone:
         """Returns the cooling setpoint in the temperature unit of the thermostat
         :return: int.
         """
-        return (
-            self._get_zone_key("setpoints")["cool"]
-            or self.thermostat.get_setpoint_limits()[1]
-        )
+        return self._get_setpoints()["cool"] or self.thermostat.get_setpoint_limits()[1]
 
     def get_heating_setpoint(self) -> int:
         """Returns the heating setpoint in the temperature unit of the thermostat
         :return: int.
         """
-        return (
-            self._get_zone_key("setpoints")["heat"]
-            or self.thermostat.get_setpoint_limits()[0]
-        )
+        return self._get_setpoints()["heat"] or self.thermostat.get_setpoint_limits()[0]
+
+    def _get_setpoints(self) -> dict[str, Any]:
+        """Returns the raw setpoints of the zone
+        :return: dict.
+        """
+        setpoints = self._setpoints
+        if setpoints is None:
+            raise KeyError('Zone key "setpoints" invalid.')
+        return setpoints
 
     def get_current_mode(self) -> str:
         """Returns the current mode of the zone. This may not match the requested
@@ -104,23 +158,15 @@ class NexiaThermostatZone:
 
         :return:
         """
-        options = self._get_zone_setting("preset_selected")["options"]
-        return [opt["label"] for opt in options]
+        self._index_preset_options(self._get_zone_setting("preset_selected"))
+        return list(self._preset_labels)
 
     def get_preset(self) -> str:
         """Returns the zone's currently selected preset. Should be one of the
         strings in NexiaThermostat.get_zone_presets().
         :return: str.
         """
-        preset_selected = self._get_zone_setting("preset_selected")
-        current_value = preset_selected["current_value"]
-        labels = preset_selected["labels"]
-        if isinstance(current_value, int):
-            return labels[current_value]
-        for option in preset_selected["options"]:
-            if option["value"] == current_value:
-                return option["label"]
-        raise ValueError(f"Unknown preset {current_value}")
+        return _resolve_preset(self._get_zone_setting("preset_selected"))
 
     def get_status(self) -> str:
         """Returns the zone status.
@@ -152,13 +198,9 @@ class NexiaThermostatZone:
             run_mode_current_value,
         )["label"]
 
-        if run_mode_current_value == HOLD_PERMANENT:
+        if run_mode_current_value in (HOLD_PERMANENT, PRESET_MODE_NONE):
             return run_mode_label
-
-        preset_label = self.get_preset()
-        if run_mode_current_value == PRESET_MODE_NONE:
-            return run_mode_label
-        return f"{run_mode_label} - {preset_label}"
+        return f"{run_mode_label} - {self.get_preset()}"
 
     def is_calling(self) -> bool:
         """Returns True if the zone is calling for heat/cool.
@@ -174,7 +216,7 @@ class NexiaThermostatZone:
         """Returns True if the zone is a NativeZone
         :return: bool.
         """
-        return str(self._get_zone_key("name")) == "NativeZone"
+        return self._is_native_zone
 
     def check_heat_cool_setpoints(
         self,
@@ -189,35 +231,28 @@ class NexiaThermostatZone:
         :param cool_temperature: int
         :return: None
         """
-        deadband = self.thermostat.get_deadband()
         (
+            deadband,
             min_temperature,
             max_temperature,
-        ) = self.thermostat.get_setpoint_limits()
+        ) = self.thermostat.get_temperature_constraints()
 
         if heat_temperature is not None:
             heat_temperature = self.round_temp(heat_temperature)
         if cool_temperature is not None:
             cool_temperature = self.round_temp(cool_temperature)
 
-        if (
-            heat_temperature is not None
-            and cool_temperature is not None
-            and not heat_temperature < cool_temperature
-        ):
-            raise AttributeError(
-                f"The heat setpoint ({heat_temperature}) must be less than the"
-                f" cool setpoint ({cool_temperature}).",
-            )
-        if (
-            heat_temperature is not None
-            and cool_temperature is not None
-            and not cool_temperature - heat_temperature >= deadband
-        ):
-            raise AttributeError(
-                f"The heat and cool setpoints must be at least {deadband} "
-                f"degrees different.",
-            )
+        if heat_temperature is not None and cool_temperature is not None:
+            if not heat_temperature < cool_temperature:
+                raise AttributeError(
+                    f"The heat setpoint ({heat_temperature}) must be less than the"
+                    f" cool setpoint ({cool_temperature}).",
+                )
+            if not cool_temperature - heat_temperature >= deadband:
+                raise AttributeError(
+                    f"The heat and cool setpoints must be at least {deadband} "
+                    f"degrees different.",
+                )
         if heat_temperature is not None and not heat_temperature <= max_temperature:
             raise AttributeError(
                 f"The heat setpoint ({heat_temperature} must be less than the "
@@ -305,45 +340,45 @@ class NexiaThermostatZone:
         deadband = self.thermostat.get_deadband()
 
         if set_temperature is None or (heat_temperature and cool_temperature):
+            # Pick the setpoint to derive from the caller's input, not the
+            # rounded values, so an explicit setpoint rounding to 0 is kept
             if heat_temperature:
                 heat_temperature = self.round_temp(heat_temperature)
+                if cool_temperature:
+                    cool_temperature = self.round_temp(cool_temperature)
+                elif heat_temperature:
+                    cool_temperature = max(
+                        self.get_cooling_setpoint(),
+                        heat_temperature + deadband,
+                    )
             elif cool_temperature:
+                cool_temperature = self.round_temp(cool_temperature)
                 heat_temperature = min(
                     self.get_heating_setpoint(),
-                    self.round_temp(cool_temperature) - deadband,
-                )
-
-            if cool_temperature:
-                cool_temperature = self.round_temp(cool_temperature)
-            elif heat_temperature:
-                cool_temperature = max(
-                    self.get_cooling_setpoint(),
-                    self.round_temp(heat_temperature) + deadband,
+                    cool_temperature - deadband,
                 )
 
         else:
             # This will smartly select either the ceiling of the floor temp
             # depending on the current operating mode.
             zone_mode = self.get_current_mode()
+            rounded_set_temperature = self.round_temp(set_temperature)
             if zone_mode == OPERATION_MODE_COOL:
-                cool_temperature = self.round_temp(set_temperature)
+                cool_temperature = rounded_set_temperature
                 heat_temperature = min(
                     self.get_heating_setpoint(),
-                    self.round_temp(cool_temperature) - deadband,
+                    cool_temperature - deadband,
                 )
             elif zone_mode == OPERATION_MODE_HEAT:
-                heat_temperature = self.round_temp(set_temperature)
+                heat_temperature = rounded_set_temperature
                 cool_temperature = max(
                     self.get_cooling_setpoint(),
-                    self.round_temp(heat_temperature) + deadband,
+                    heat_temperature + deadband,
                 )
             else:
-                cool_temperature = self.round_temp(set_temperature) + math.ceil(
-                    deadband / 2,
-                )
-                heat_temperature = self.round_temp(set_temperature) - math.ceil(
-                    deadband / 2,
-                )
+                half_deadband = math.ceil(deadband / 2)
+                cool_temperature = rounded_set_temperature + half_deadband
+                heat_temperature = rounded_set_temperature - half_deadband
 
         await self._set_setpoints(cool_temperature, heat_temperature)
 
@@ -372,8 +407,13 @@ class NexiaThermostatZone:
     ) -> None:
         # Check that the setpoints are valid
         self.check_heat_cool_setpoints(heat_temperature, cool_temperature)
-        zone_cooling_setpoint = self.get_cooling_setpoint()
-        zone_heating_setpoint = self.get_heating_setpoint()
+        setpoints = self._get_setpoints()
+        zone_cooling_setpoint = setpoints["cool"]
+        zone_heating_setpoint = setpoints["heat"]
+        if not zone_cooling_setpoint or not zone_heating_setpoint:
+            min_setpoint, max_setpoint = self.thermostat.get_setpoint_limits()
+            zone_cooling_setpoint = zone_cooling_setpoint or max_setpoint
+            zone_heating_setpoint = zone_heating_setpoint or min_setpoint
         if (
             zone_cooling_setpoint != cool_temperature
             or heat_temperature != zone_heating_setpoint
@@ -389,13 +429,11 @@ class NexiaThermostatZone:
         NexiaThermostat.get_zone_presets(zone_id)
         :return: None.
         """
-        if self.get_preset() != preset:
-            preset_selected = self._get_zone_setting("preset_selected")
-            value = 0
-            for option in preset_selected["options"]:
-                if option["label"] == preset:
-                    value = option["value"]
-                    break
+        preset_selected = self._get_zone_setting("preset_selected")
+        if _resolve_preset(preset_selected) != preset:
+            self._index_preset_options(preset_selected)
+            # Unknown presets post 0 as they always have
+            value = self._preset_label_to_value.get(preset, 0)
             await self._post_and_update_zone_json("preset_selected", {"value": value})
 
     async def set_mode(self, mode: str) -> None:
@@ -404,7 +442,7 @@ class NexiaThermostatZone:
         :return:
         """
         # Validate the data
-        if mode in OPERATION_MODES:
+        if mode in _OPERATION_MODES_SET:
             await self._post_and_update_zone_json("zone_mode", {"value": mode})
         else:
             raise KeyError(
@@ -418,17 +456,8 @@ class NexiaThermostatZone:
         :return: float rounded temperature.
         """
         if self.thermostat.get_unit() == UNIT_CELSIUS:
-            temperature *= 2
-            temperature = round(temperature)
-            temperature /= 2
-        else:
-            temperature = round(temperature)
-        return temperature
-
-    @property
-    def _has_zoning(self) -> bool:
-        """Returns if zoning is enabled."""
-        return bool(self._zone_json["settings"])
+            return round(temperature * 2) * 0.5
+        return round(temperature)
 
     def _get_zone_setting(self, key: str) -> Any:
         """Returns the zone value for the key and zone_id provided.
@@ -437,15 +466,12 @@ class NexiaThermostatZone:
         """
         if not self._has_zoning:
             thermostat = self.thermostat
-            if key == "zone_mode":
-                key = "system_mode"
-
+            key = _NON_ZONING_SETTING_KEYS.get(key, key)
             return thermostat.get_thermostat_settings_key_or_none(
                 key,
             ) or thermostat.get_thermostat_settings_key_or_none("mode")
 
-        zone = self._zone_json
-        subdict = find_dict_with_keyvalue_in_json(zone["settings"], "type", key)
+        subdict = self._settings_by_type.get(key)
         if not subdict:
             raise KeyError(f'Zone settings key "{key}" invalid.')
         return subdict
@@ -467,28 +493,58 @@ class NexiaThermostatZone:
 
         :return: The value of the key/value pair.
         """
-        zone = self._zone_json
-        subdict = find_dict_with_keyvalue_in_json(zone["features"], "name", key)
+        subdict = self._features_by_name.get(key)
         if not subdict:
             raise KeyError(f'Zone feature key "{key}" invalid.')
         return subdict
 
+    def _rebuild_indexes(self) -> None:
+        """Rebuild all the lookup tables derived from the zone's JSON."""
+        self._index_settings()
+        self._index_features()
+
+    def _index_settings(self) -> None:
+        """Rebuild the lookup tables derived from the zone's settings."""
+        settings = self._zone_json.get("settings")
+        # Zones without their own settings defer to the thermostat
+        self._has_zoning = bool(settings)
+        self._settings_by_type = index_dicts_by_key(settings or (), "type")
+
+    def _index_features(self) -> None:
+        """Rebuild the lookup table derived from the zone's features."""
+        self._features_by_name = index_dicts_by_key(
+            self._zone_json.get("features") or (), "name"
+        )
+
+    def _index_preset_options(self, preset_selected: dict[str, Any]) -> None:
+        """Rebuild the preset lookup tables if the options list has changed."""
+        options = preset_selected["options"]
+        if options is self._preset_options:
+            # The options list is replaced, not mutated, when new json arrives
+            return
+        self._preset_options = options
+        self._preset_labels = tuple(opt["label"] for opt in options)
+        # Reversed so the first option with a given label wins
+        self._preset_label_to_value = {
+            opt["label"]: opt["value"] for opt in reversed(options)
+        }
+
     def _get_zone_key(self, key: str) -> Any:
         """Returns the zone value for the key provided.
         :param key: str
         :return: The value of the key/value pair.
         """
-        if key in self._zone_json:
-            return self._zone_json[key]
-
-        raise KeyError(f'Zone key "{key}" invalid.')
+        value = self._zone_json.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(f'Zone key "{key}" invalid.')
+        return value
 
     async def _post_and_update_zone_json(
         self,
         end_point: str,
         payload: dict[str, Any],
     ) -> None:
-        url = self.API_MOBILE_ZONE_URL.format(end_point=end_point, zone_id=self.zone_id)
+        url = f"{self._url_prefix}{end_point}"
         async with await self._nexia_home.post_url(url, payload) as response:
             self.update_zone_json((await response.json())["result"])
 
@@ -503,3 +559,12 @@ class NexiaThermostatZone:
             self.zone_id,
         )
         self._zone_json.update(zone_json)
+        if "name" in zone_json:
+            self._is_native_zone = zone_json["name"] == "NativeZone"
+        if "setpoints" in zone_json:
+            self._setpoints = zone_json["setpoints"]
+        # Only rebuild the lookup tables for the sections this update replaced
+        if "settings" in zone_json:
+            self._index_settings()
+        if "features" in zone_json:
+            self._index_features()
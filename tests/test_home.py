@@ -9,6 +9,7 @@ from pathlib import Path
 import aiohttp
 import pytest
 from aioresponses import aioresponses
+from yarl import URL
 
 from nexia.home import (
     LoginFailedException,
@@ -185,6 +186,7 @@ async def test_idle_thermo(aiohttp_session: aiohttp.ClientSession) -> None:
     assert thermostat.get_name() == "Downstairs East Wing"
     assert thermostat.get_deadband() == 3
     assert thermostat.get_setpoint_limits() == (55, 99)
+    assert thermostat.get_temperature_constraints() == (3, 55, 99)
     assert thermostat.get_variable_fan_speed_limits() == (0.35, 1.0)
     assert thermostat.get_unit() == "F"
     assert thermostat.get_humidity_setpoint_limits() == (0.35, 0.65)
@@ -1132,3 +1134,249 @@ async def test_emergency_heat(aiohttp_session: aiohttp.ClientSession) -> None:
     assert zone.get_setpoint_status() == "Run Schedule - None"
     assert zone.is_calling() is True
     assert zone.is_in_permanent_hold() is False
+
+
+async def test_set_fan_mode(mock_aioresponse: aioresponses) -> None:
+    """Test setting the fan mode by label."""
+    aiohttp_session = aiohttp.ClientSession()
+    nexia = NexiaHome(aiohttp_session)
+    devices_json = json.loads(await load_fixture("mobile_house_issue_33758.json"))
+    nexia.update_from_json(devices_json)
+
+    thermostat: NexiaThermostat = nexia.get_thermostat_by_id(12345678)
+    assert thermostat.get_fan_mode() == "Auto"
+
+    devices = _extract_devices_from_houses_json(devices_json)
+    url = "https://www.mynexia.com/mobile/xxl_thermostats/12345678/fan_mode"
+    mock_aioresponse.post(url, payload={"result": devices[0]})
+    await thermostat.set_fan_mode("Circulate")
+
+    requests = mock_aioresponse.requests[("POST", URL(url))]
+    assert requests[0].kwargs["json"] == {"value": "circulate"}
+
+    # The response still reports "auto" so setting it again is a no-op
+    await thermostat.set_fan_mode("Auto")
+    assert len(requests) == 1
+    await aiohttp_session.close()
+
+
+async def test_setters_skip_unchanged_values(
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test setters only post when the value differs from the current one."""
+    aiohttp_session = aiohttp.ClientSession()
+    nexia = NexiaHome(aiohttp_session)
+    devices_json = json.loads(await load_fixture("mobile_house_issue_33758.json"))
+    nexia.update_from_json(devices_json)
+
+    thermostat: NexiaThermostat = nexia.get_thermostat_by_id(12345678)
+    assert thermostat.get_fan_speed_setpoint() == 1
+    assert thermostat.is_emergency_heat_active() is False
+
+    devices = _extract_devices_from_houses_json(devices_json)
+    base_url = "https://www.mynexia.com/mobile/xxl_thermostats/12345678"
+    for end_point in ("fan_speed", "scheduling_enabled", "emergency_heat"):
+        mock_aioresponse.post(
+            f"{base_url}/{end_point}", payload={"result": devices[0]}, repeat=True
+        )
+
+    def posted(end_point: str) -> list:
+        return mock_aioresponse.requests.get(
+            ("POST", URL(f"{base_url}/{end_point}")), []
+        )
+
+    await thermostat.set_fan_setpoint(1.0)
+    assert len(posted("fan_speed")) == 0
+    await thermostat.set_fan_setpoint(0.5)
+    assert len(posted("fan_speed")) == 1
+    assert posted("fan_speed")[0].kwargs["json"] == {"value": 0.5}
+
+    # Truthy values are coerced to a bool before being compared
+    await thermostat.set_follow_schedule(1)
+    assert len(posted("scheduling_enabled")) == 0
+    await thermostat.set_follow_schedule(False)
+    assert len(posted("scheduling_enabled")) == 1
+    assert posted("scheduling_enabled")[0].kwargs["json"] == {"value": "false"}
+
+    await thermostat.set_emergency_heat(0)
+    assert len(posted("emergency_heat")) == 0
+    await thermostat.set_emergency_heat(True)
+    assert len(posted("emergency_heat")) == 1
+    assert posted("emergency_heat")[0].kwargs["json"] == {"value": "true"}
+    await aiohttp_session.close()
+
+
+async def test_set_preset(mock_aioresponse: aioresponses) -> None:
+    """Test setting a zone preset by label."""
+    aiohttp_session = aiohttp.ClientSession()
+    nexia = NexiaHome(aiohttp_session)
+    devices_json = json.loads(await load_fixture("mobile_house_issue_33758.json"))
+    nexia.update_from_json(devices_json)
+
+    thermostat: NexiaThermostat = nexia.get_thermostat_by_id(12345678)
+    zone = thermostat.get_zone_by_id(12345678)
+    assert zone.get_preset() == "None"
+
+    devices = _extract_devices_from_houses_json(devices_json)
+    url = "https://www.mynexia.com/mobile/xxl_zones/12345678/preset_selected"
+    mock_aioresponse.post(url, payload={"result": devices[0]["zones"][0]})
+    await zone.set_preset("Away")
+
+    requests = mock_aioresponse.requests[("POST", URL(url))]
+    assert requests[0].kwargs["json"] == {"value": 2}
+
+    # The response still reports "None" so setting it again is a no-op
+    await zone.set_preset("None")
+    assert len(requests) == 1
+    await aiohttp_session.close()
+
+
+async def test_set_heat_cool_temp_rounding_to_zero(
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test an explicit setpoint that rounds to 0 is not replaced."""
+    aiohttp_session = aiohttp.ClientSession()
+    nexia = NexiaHome(aiohttp_session)
+    devices_json = json.loads(await load_fixture("mobile_house_issue_33968.json"))
+    nexia.update_from_json(devices_json)
+
+    thermostat: NexiaThermostat = nexia.get_thermostat_by_id(1690380)
+    zone = thermostat.get_zone_by_id(83037337)
+
+    devices = _extract_devices_from_houses_json(devices_json)
+    url = "https://www.mynexia.com/mobile/xxl_zones/83037337/setpoints"
+    mock_aioresponse.post(url, payload={"result": devices[0]["zones"][0]})
+
+    with pytest.raises(AttributeError):
+        await zone.set_heat_cool_temp(heat_temperature=70, cool_temperature=0.4)
+    assert ("POST", URL(url)) not in mock_aioresponse.requests
+
+    await zone.set_heat_cool_temp(heat_temperature=0.3, cool_temperature=80)
+    requests = mock_aioresponse.requests[("POST", URL(url))]
+    assert requests[0].kwargs["json"] == {"heat": 0, "cool": 80}
+    await aiohttp_session.close()
+
+
+async def test_set_humidity_setpoints(mock_aioresponse: aioresponses) -> None:
+    """Test setting both humidity setpoints."""
+    aiohttp_session = aiohttp.ClientSession()
+    nexia = NexiaHome(aiohttp_session)
+    devices_json = json.loads(await load_fixture("mobile_house_issue_33758.json"))
+    nexia.update_from_json(devices_json)
+
+    thermostat: NexiaThermostat = nexia.get_thermostat_by_id(12345678)
+    assert thermostat.has_dehumidify_support() is True
+    assert thermostat.has_humidify_support() is True
+
+    devices = _extract_devices_from_houses_json(devices_json)
+    base_url = "https://www.mynexia.com/mobile/xxl_thermostats/12345678"
+    mock_aioresponse.post(f"{base_url}/dehumidify", payload={"result": devices[0]})
+    mock_aioresponse.post(f"{base_url}/humidify", payload={"result": devices[0]})
+    await thermostat.set_humidity_setpoints(
+        dehumidify_setpoint=0.62, humidify_setpoint=0.47
+    )
+
+    requests = mock_aioresponse.requests
+    assert requests[("POST", URL(f"{base_url}/dehumidify"))][0].kwargs["json"] == {
+        "value": "0.6"
+    }
+    assert requests[("POST", URL(f"{base_url}/humidify"))][0].kwargs["json"] == {
+        "value": "0.45"
+    }
+
+    # The response reports a dehumidify setpoint of 0.55 so this is a no-op
+    await thermostat.set_dehumidify_setpoint(0.55)
+    assert len(requests[("POST", URL(f"{base_url}/dehumidify"))]) == 1
+    assert len(requests[("POST", URL(f"{base_url}/humidify"))]) == 1
+
+    with pytest.raises(ValueError):
+        await thermostat.set_humidity_setpoints(
+            dehumidify_setpoint=0.4, humidify_setpoint=0.6
+        )
+    await aiohttp_session.close()
+
+
+async def test_zone_data_from_thermostat_update(
+    aiohttp_session: aiohttp.ClientSession,
+) -> None:
+    """Test zone data in a thermostat update reaches the zones."""
+    nexia = NexiaHome(aiohttp_session)
+    devices_json = json.loads(await load_fixture("mobile_house_issue_33758.json"))
+    nexia.update_from_json(devices_json)
+    thermostat = nexia.get_thermostat_by_id(12345678)
+
+    updated_json = json.loads(await load_fixture("mobile_house_issue_33758.json"))
+    devices = _extract_devices_from_houses_json(updated_json)
+    devices[0]["zones"][0]["temperature"] = 12
+    nexia.update_from_json(updated_json)
+
+    zone = thermostat.get_zone_by_id(12345678)
+    assert zone.get_temperature() == 12
+    assert thermostat.zones == [zone]
+    with pytest.raises(KeyError, match="valid IDs are: 12345678"):
+        thermostat.get_zone_by_id(1)
+
+
+async def test_update_with_some_zones(
+    aiohttp_session: aiohttp.ClientSession,
+) -> None:
+    """Test an update carrying only some zones keeps the others."""
+    nexia = NexiaHome(aiohttp_session)
+    devices_json = json.loads(await load_fixture("mobile_house_issue_33968.json"))
+    nexia.update_from_json(devices_json)
+    thermostat = nexia.get_thermostat_by_id(1690380)
+
+    updated_json = json.loads(await load_fixture("mobile_house_issue_33968.json"))
+    thermostat_json = _extract_devices_from_houses_json(updated_json)[0]
+    zone_json = thermostat_json["zones"][0]
+    zone_json["temperature"] = 12
+    thermostat.update_thermostat_json({"zones": [zone_json]})
+
+    assert thermostat.get_zone_ids() == [83037337, 83037340, 83037343]
+    assert thermostat.get_zone_by_id(83037337).get_temperature() == 12
+    assert thermostat.get_zone_by_id(83037343).get_temperature() == 77
+    assert [zone.zone_id for zone in thermostat.zones] == [
+        83037337,
+        83037340,
+        83037343,
+    ]
+
+
+async def test_unit_change_from_features_update(
+    aiohttp_session: aiohttp.ClientSession,
+) -> None:
+    """Test a features only update switching the unit reaches the zones."""
+    nexia = NexiaHome(aiohttp_session)
+    devices_json = json.loads(await load_fixture("mobile_house_issue_33758.json"))
+    nexia.update_from_json(devices_json)
+    thermostat = nexia.get_thermostat_by_id(12345678)
+    zone = thermostat.get_zone_by_id(12345678)
+    assert thermostat.get_unit() == "F"
+    assert zone.round_temp(72.4) == 72
+
+    updated_json = json.loads(await load_fixture("mobile_house_issue_33758.json"))
+    features = _extract_devices_from_houses_json(updated_json)[0]["features"]
+    for feature in features:
+        if feature["name"] == "thermostat":
+            feature["scale"] = "c"
+    thermostat.update_thermostat_json({"features": features})
+
+    assert thermostat.get_unit() == "C"
+    assert zone.round_temp(21.3) == 21.5
+
+
+async def test_partial_thermostat_update(
+    aiohttp_session: aiohttp.ClientSession,
+) -> None:
+    """Test an update without zones only touches the thermostat."""
+    nexia = NexiaHome(aiohttp_session)
+    devices_json = json.loads(await load_fixture("mobile_house_issue_33758.json"))
+    nexia.update_from_json(devices_json)
+    thermostat = nexia.get_thermostat_by_id(12345678)
+    zone = thermostat.get_zone_by_id(12345678)
+
+    thermostat.update_thermostat_json({"system_status": "Cooling"})
+    assert thermostat.get_system_status() == "Cooling"
+    assert thermostat.is_blower_active() is True
+    assert thermostat.get_fan_mode() == "Auto"
+    assert zone.get_current_mode() == "AUTO"